@@ -1,31 +1,84 @@
 #!/usr/bin/env python3
 import json
-import subprocess
+import os
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import re
 
-def get_playlist_videos(playlist_url):
-    """Fetch all videos from the playlist"""
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
+
+try:
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+except ImportError:  # openai is optional; summaries fall back to text extraction
+    AsyncOpenAI = None
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken is optional; fall back to a character budget
+    tiktoken = None
+
+# Maximum number of videos processed at the same time
+MAX_CONCURRENCY = 10
+
+# Model used for summaries and the transcript token budget sent to it
+SUMMARY_MODEL = "gpt-4o-mini"
+MAX_INPUT_TOKENS = 3750
+
+# Upper bound for a single line of yt-dlp --dump-json output
+PLAYLIST_LINE_LIMIT = 16 * 1024 * 1024
+
+# Collapses runs of whitespace in subtitle text
+WHITESPACE_RE = re.compile(r'\s+')
+
+async def iter_playlist_videos(playlist_url):
+    """Yield playlist videos as yt-dlp emits them, without buffering the dump"""
     cmd = ['yt-dlp', '--flat-playlist', '--dump-json', playlist_url]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        limit=PLAYLIST_LINE_LIMIT,
+    )
     
-    videos = []
-    for line in result.stdout.strip().split('\n'):
-        if line:
-            video_data = json.loads(line)
-            videos.append({
-                'index': video_data.get('playlist_index', 0),
-                'id': video_data['id'],
-                'title': video_data['title'],
-                'url': f"https://www.youtube.com/watch?v={video_data['id']}"
-            })
+    reached_eof = False
+    try:
+        # Parse one JSON record per line as yt-dlp emits them
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                reached_eof = True
+                break
+            line = line.strip()
+            if line:
+                video_data = json_loads(line)
+                yield {
+                    'index': video_data.get('playlist_index', 0),
+                    'id': video_data['id'],
+                    'title': video_data['title'],
+                    'url': f"https://www.youtube.com/watch?v={video_data['id']}"
+                }
+    finally:
+        # At EOF yt-dlp is exiting on its own; only kill it when closed early
+        if not reached_eof and proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        await proc.wait()
+
+async def get_playlist_videos(playlist_url):
+    """Fetch all videos from the playlist"""
+    videos = [video async for video in iter_playlist_videos(playlist_url)]
     
     # Sort by playlist index
     videos.sort(key=lambda x: x['index'])
     return videos
 
-def get_video_subtitles(video_id):
+async def get_video_subtitles(video_id):
     """Fetch subtitles for a single video"""
     try:
         cmd = [
@@ -37,28 +90,40 @@ def get_video_subtitles(video_id):
             '--output', f'/tmp/%(id)s.%(ext)s',
             f'https://www.youtube.com/watch?v={video_id}'
         ]
-        subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            await asyncio.wait_for(proc.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
         
         # Read the subtitle file
         subtitle_file = f'/tmp/{video_id}.en.json3'
         try:
-            with open(subtitle_file, 'r') as f:
-                subtitle_data = json.load(f)
+            with open(subtitle_file, 'rb') as f:
+                subtitle_data = json_loads(f.read())
                 
             # Extract text from subtitles
-            text_parts = []
-            for event in subtitle_data.get('events', []):
-                if 'segs' in event:
-                    for seg in event['segs']:
-                        if 'utf8' in seg:
-                            text_parts.append(seg['utf8'])
+            text_parts = [
+                seg['utf8']
+                for event in subtitle_data.get('events', ())
+                for seg in event.get('segs', ())
+                if 'utf8' in seg
+            ]
             
-            full_text = ''.join(text_parts)
             # Clean up the text
-            full_text = re.sub(r'\s+', ' ', full_text).strip()
+            full_text = WHITESPACE_RE.sub(' ', ''.join(text_parts)).strip()
             
             # Clean up the file
-            subprocess.run(['rm', '-f', subtitle_file], capture_output=True)
+            try:
+                os.unlink(subtitle_file)
+            except FileNotFoundError:
+                pass
             
             return full_text
         except FileNotFoundError:
@@ -68,20 +133,54 @@ def get_video_subtitles(video_id):
         print(f"Error fetching subtitles for {video_id}: {e}")
         return None
 
-def summarize_text(text, title):
+# Loaded on first use; False when loading fails (tiktoken downloads the
+# encoding on first use, so this happens offline) to skip retrying every call
+_ENCODING = None
+
+def truncate_to_tokens(text, max_tokens=MAX_INPUT_TOKENS):
+    """Truncate text to at most max_tokens tokens of the summary model"""
+    global _ENCODING
+    if tiktoken is None or _ENCODING is False:
+        # Roughly four characters per token for English text
+        return text[:max_tokens * 4]
+    if _ENCODING is None:
+        try:
+            _ENCODING = tiktoken.encoding_for_model(SUMMARY_MODEL)
+        except Exception as e:
+            print(f"Could not load tiktoken encoding, using a character budget instead: {e}")
+            _ENCODING = False
+            return text[:max_tokens * 4]
+    tokens = _ENCODING.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return _ENCODING.decode(tokens[:max_tokens])
+
+_CLIENT = None
+
+def _client():
+    """Return the shared OpenAI client, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        if AsyncOpenAI is None:
+            raise ImportError("the openai package is required for summaries")
+        _CLIENT = AsyncOpenAI(
+            api_key=os.environ.get('OPENAI_API_KEY'),
+            http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(max_connections=64)),
+        )
+    return _CLIENT
+
+async def summarize_text(text, title):
     """Generate a summary using OpenAI API"""
-    import os
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+        client = _client()
         
         prompt = f"""Summarize this conference talk transcript in about half a page to a page. Focus on the key points, main ideas, and takeaways. The talk is titled: "{title}"
 
 Transcript:
-{text[:15000]}"""  # Limit to avoid token limits
+{truncate_to_tokens(text)}"""
         
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+        response = await client.chat.completions.create(
+            model=SUMMARY_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that creates concise, informative summaries of technical conference talks."},
                 {"role": "user", "content": prompt}
@@ -98,18 +197,18 @@ Transcript:
             return text[:1000] + "..."
         return text
 
-async def process_video(video, executor):
+async def process_video(video, sem):
     """Process a single video asynchronously"""
-    print(f"Processing [{video['index']}]: {video['title']}")
-    
-    loop = asyncio.get_event_loop()
-    subtitles = await loop.run_in_executor(executor, get_video_subtitles, video['id'])
-    
-    if subtitles and len(subtitles) > 200:
-        # Generate a summary using AI
-        summary = await loop.run_in_executor(executor, summarize_text, subtitles, video['title'])
-    else:
-        summary = "No subtitles available for this video."
+    async with sem:
+        print(f"Processing [{video['index']}]: {video['title']}")
+        
+        subtitles = await get_video_subtitles(video['id'])
+        
+        if subtitles and len(subtitles) > 200:
+            # Generate a summary using AI
+            summary = await summarize_text(subtitles, video['title'])
+        else:
+            summary = "No subtitles available for this video."
     
     return {
         'index': video['index'],
@@ -122,12 +221,14 @@ async def main():
     playlist_url = "https://www.youtube.com/playlist?list=PLj6h78yzYM2MP0QhYFK8HOb8UqgbIkLMc"
     
     print("Fetching playlist videos...")
-    videos = get_playlist_videos(playlist_url)
-    print(f"Found {len(videos)} videos")
     
-    # Process videos asynchronously
-    executor = ThreadPoolExecutor(max_workers=10)
-    tasks = [process_video(video, executor) for video in videos]
+    # Start processing each video as soon as yt-dlp reports it,
+    # at most MAX_CONCURRENCY at a time
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    tasks = []
+    async for video in iter_playlist_videos(playlist_url):
+        tasks.append(asyncio.ensure_future(process_video(video, sem)))
+    print(f"Found {len(tasks)} videos")
     
     results = await asyncio.gather(*tasks)
     
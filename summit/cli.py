@@ -8,9 +8,17 @@ from datetime import datetime
 from pathlib import Path
 
 from .core import process_playlist
-from .render import render_markdown, render_marp_deck, render_html_page
+from .render import render_markdown, render_marp_deck, render_html_page, sort_items
 from .sched import process_sched_talks
-from .summarizers import get_summarizer
+from .summarizers import aclose_all, get_summarizer
+
+
+async def _run_and_close(coro):
+    """Await coro, then close the shared summarizer HTTP clients on the same loop."""
+    try:
+        return await coro
+    finally:
+        await aclose_all()
 
 
 def main():
@@ -83,7 +91,37 @@ def main():
         "--sleep",
         type=int,
         default=0,
-        help="Seconds to sleep between sched.com detail page requests (default: 0)."
+        help="Seconds to wait after each sched.com detail page request sent; cached talks don't wait (default: 0)."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of YouTube subtitle downloads to run concurrently (default: 10)."
+    )
+    parser.add_argument(
+        "--sched-concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of sched.com detail pages to fetch concurrently (default: 16)."
+    )
+    parser.add_argument(
+        "--summary-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of summaries to generate concurrently (default: 8)."
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        help="Size of the summarizer's pooled HTTP connection pool (anthropic, openai, and ollama only; default: 64)."
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=None,
+        help="Maximum summarizer requests per minute, e.g. your provider's published RPM limit (default: unlimited)."
     )
     parser.add_argument(
         "--proxy",
@@ -116,6 +154,10 @@ def main():
         summarizer_kwargs = {"summary_length": summary_length}
         if model:
             summarizer_kwargs["model"] = model
+        if args.max_connections and strategy != "gemini":
+            summarizer_kwargs["max_connections"] = args.max_connections
+        if args.rpm:
+            summarizer_kwargs["rpm"] = args.rpm
 
         print(f"Using {strategy} summarizer" + (f" (model: {model})" if model else "") + "...")
         summarizer = get_summarizer(strategy, **summarizer_kwargs)
@@ -123,7 +165,7 @@ def main():
     # Detect if URL is sched.com or YouTube playlist
     if 'sched.com' in args.playlist_url:
         print("Detected sched.com URL, processing conference talks...")
-        data = asyncio.run(process_sched_talks(
+        data = asyncio.run(_run_and_close(process_sched_talks(
             args.playlist_url,
             summarizer=summarizer,
             limit=args.limit,
@@ -133,7 +175,9 @@ def main():
             sleep=args.sleep,
             use_summary_cache=use_summary_cache,
             proxy=args.proxy,
-        ))
+            sched_concurrency=args.sched_concurrency,
+            summary_concurrency=args.summary_concurrency,
+        )))
     else:
         # Process YouTube playlist
         if strategy == "disabled":
@@ -141,7 +185,7 @@ def main():
                   "Please choose one of: anthropic, openai, gemini, ollama.")
             sys.exit(1)
         print("Starting playlist processing...")
-        data = asyncio.run(process_playlist(
+        data = asyncio.run(_run_and_close(process_playlist(
             args.playlist_url, 
             summarizer=summarizer, 
             limit=args.limit,
@@ -149,7 +193,9 @@ def main():
             use_summary_cache=use_summary_cache,
             proxy=args.proxy,
             sleep=args.sleep,
-        ))
+            concurrency=args.concurrency,
+            summary_concurrency=args.summary_concurrency,
+        )))
     
     if not data:
         print("No videos were processed successfully.")
@@ -162,22 +208,25 @@ def main():
     # Generate timestamp for filenames
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     
+    # Sort once and share the ordering across all renderers
+    sorted_items = sort_items(data)
+
     # Render markdown summary
     print(f"\nGenerating markdown summary...")
-    markdown = render_markdown(data, title=args.title)
+    markdown = render_markdown(data, title=args.title, sorted_items=sorted_items)
     summary_path = output_dir / f"summary-{timestamp}.md"
     summary_path.write_text(markdown)
     print(f"✓ Summary written to: {summary_path.absolute()}")
     
     print(f"\nGenerating HTML summary...")
-    html = render_html_page(data, title=args.title)
+    html = render_html_page(data, title=args.title, sorted_items=sorted_items)
     html_path = output_dir / f"summary-{timestamp}.html"
     html_path.write_text(html)
     print(f"✓ HTML summary written to: {html_path.absolute()}")
     
     # Render Marp deck
     print(f"\nGenerating Marp presentation deck...")
-    marp_deck = render_marp_deck(data, title=args.title)
+    marp_deck = render_marp_deck(data, title=args.title, sorted_items=sorted_items)
     deck_path = output_dir / f"summary-{timestamp}-deck.md"
     deck_path.write_text(marp_deck)
     print(f"✓ Marp deck written to: {deck_path.absolute()}")
@@ -6,6 +6,8 @@ import json
 from logging import warning
 import re
 import os
+import sqlite3
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
@@ -15,6 +17,31 @@ from youtube_transcript_api.proxies import WebshareProxyConfig
 
 from .summarizers import Summarizer, get_summarizer
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Characters that are not safe to use in cache keys / filenames
+_KEY_RE = re.compile(r"[^A-Za-z0-9._-]")
+
 
 def get_cache_dir() -> Path:
     """Get or create the cache directory."""
@@ -25,62 +52,107 @@ def get_cache_dir() -> Path:
 
 def get_playlist_cache_path(playlist_url: str) -> Path:
     """Get the cache file path for a playlist."""
-    # Create a hash of the playlist URL to use as filename
-    url_hash = hashlib.md5(playlist_url.encode()).hexdigest()
+    # Create a (non-cryptographic) hash of the playlist URL to use as filename
+    url_hash = hashlib.blake2b(playlist_url.encode(), digest_size=16).hexdigest()
     return get_cache_dir() / f'playlist_{url_hash}.json'
 
 
 def load_playlist_cache(playlist_url: str) -> Optional[List[Dict]]:
     """Load cached playlist data if it exists."""
     cache_path = get_playlist_cache_path(playlist_url)
-    if cache_path.exists():
-        try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
-                print(f"Using cached playlist data from {cache_path}")
-                return data
-        except Exception as e:
-            print(f"Error loading cache: {e}")
-            return None
-    return None
+    try:
+        data = json_loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading cache: {e}")
+        return None
+    print(f"Using cached playlist data from {cache_path}")
+    return data
 
 
 def save_playlist_cache(playlist_url: str, videos: List[Dict]) -> None:
     """Save playlist data to cache."""
     cache_path = get_playlist_cache_path(playlist_url)
     try:
-        with open(cache_path, 'w') as f:
-            json.dump(videos, f, indent=2)
+        cache_path.write_bytes(json_dumps(videos))
         print(f"Cached playlist data to {cache_path}")
     except Exception as e:
         print(f"Error saving cache: {e}")
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_db_lock = threading.Lock()
+
+
+def get_cache_db_path() -> Path:
+    """Get the path of the SQLite database holding subtitle and summary caches."""
+    return get_cache_dir() / 'cache.db'
+
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Open the shared cache database on first use. Callers must hold _cache_db_lock."""
+    global _cache_db
+    if _cache_db is None:
+        conn = sqlite3.connect(str(get_cache_db_path()), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS subtitles (video_id TEXT PRIMARY KEY, text TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "video_id TEXT NOT NULL, summarizer TEXT NOT NULL, text TEXT NOT NULL, "
+            "PRIMARY KEY (video_id, summarizer))"
+        )
+        _cache_db = conn
+    return _cache_db
+
+
+def _cache_db_fetch(sql: str, params: tuple) -> Optional[str]:
+    """Run a single-value SELECT against the cache database."""
+    with _cache_db_lock:
+        row = _get_cache_db().execute(sql, params).fetchone()
+    return row[0] if row is not None else None
+
+
+def _cache_db_write(sql: str, params: tuple) -> None:
+    """Run a write statement against the cache database."""
+    with _cache_db_lock:
+        _get_cache_db().execute(sql, params)
+
+
+def _load_legacy_cache_file(cache_path: Path) -> Optional[str]:
+    """Read a cache entry written by older versions (one text file per entry)."""
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
 def get_subtitle_cache_path(video_id: str) -> Path:
-    """Get the cache file path for subtitles of a specific video."""
-    subtitle_dir = Path.home() / '.cache' / 'subtitles'
-    subtitle_dir.mkdir(parents=True, exist_ok=True)
-    return subtitle_dir / f"subtitles_{video_id}.txt"
+    """Get the legacy cache file path for subtitles of a specific video."""
+    return Path.home() / '.cache' / 'subtitles' / f"subtitles_{video_id}.txt"
 
 
 def load_subtitle_cache(video_id: str) -> Optional[str]:
     """Load cached subtitles for a video if available."""
-    cache_path = get_subtitle_cache_path(video_id)
-    if cache_path.exists():
-        try:
-            text = cache_path.read_text(encoding="utf-8")
-            print(f"Using cached subtitles for video {video_id} from {cache_path}")
-            return text
-        except Exception as e:
-            print(f"Error loading subtitle cache for {video_id}: {e}")
-            return None
-    return None
+    try:
+        text = _cache_db_fetch("SELECT text FROM subtitles WHERE video_id = ?", (video_id,))
+        if text is None:
+            # Fall back to (and migrate) subtitles cached by older versions
+            text = _load_legacy_cache_file(get_subtitle_cache_path(video_id))
+            if text is None:
+                return None
+            _cache_db_write("INSERT OR REPLACE INTO subtitles (video_id, text) VALUES (?, ?)", (video_id, text))
+        print(f"Using cached subtitles for video {video_id}")
+        return text
+    except Exception as e:
+        print(f"Error loading subtitle cache for {video_id}: {e}")
+        return None
 
 
 def save_subtitle_cache(video_id: str, subtitles: str) -> None:
     """Save subtitles for a video to cache."""
-    cache_path = get_subtitle_cache_path(video_id)
     try:
-        cache_path.write_text(subtitles, encoding="utf-8")
-        print(f"Cached subtitles for video {video_id} to {cache_path}")
+        _cache_db_write("INSERT OR REPLACE INTO subtitles (video_id, text) VALUES (?, ?)", (video_id, subtitles))
+        print(f"Cached subtitles for video {video_id}")
     except Exception as e:
         print(f"Error saving subtitle cache for {video_id}: {e}")
 
@@ -90,7 +162,12 @@ def _summarizer_cache_key_parts(summarizer: Summarizer) -> str:
 
     We include the class name, model (if present), and summary_length (if present)
     so that switching models or target lengths results in separate cache files.
+    The key is computed once and memoized on the summarizer instance.
     """
+    cached_key = getattr(summarizer, "_cache_key", None)
+    if cached_key is not None:
+        return cached_key
+
     cls_name = summarizer.__class__.__name__
     model = getattr(summarizer, "model", None)
     summary_length = getattr(summarizer, "summary_length", None)
@@ -103,42 +180,59 @@ def _summarizer_cache_key_parts(summarizer: Summarizer) -> str:
 
     raw = "_".join(parts)
     # Make safe for filenames
-    safe = re.sub(r"[^A-Za-z0-9._-]", "_", raw)
+    safe = _KEY_RE.sub("_", raw)
+    summarizer._cache_key = safe
     return safe
 
 
 def get_summary_cache_path(video_id: str, summarizer: Summarizer) -> Path:
-    """Get the cache file path for a summarized video for a given summarizer."""
+    """Get the legacy cache file path for a summarized video for a given summarizer."""
     key = _summarizer_cache_key_parts(summarizer)
-    summary_dir = get_cache_dir() / 'summaries'
-    summary_dir.mkdir(parents=True, exist_ok=True)
-    return summary_dir / f"summary_{video_id}_{key}.txt"
+    return get_cache_dir() / 'summaries' / f"summary_{video_id}_{key}.txt"
 
 
 def load_summary_cache(video_id: str, summarizer: Summarizer) -> Optional[str]:
     """Load cached summary for a video/summarizer combo if available."""
-    cache_path = get_summary_cache_path(video_id, summarizer)
-    if cache_path.exists():
-        try:
-            text = cache_path.read_text(encoding="utf-8")
-            print(f"Using cached summary for video {video_id} from {cache_path}")
-            return text
-        except Exception as e:
-            print(f"Error loading summary cache for {video_id}: {e}")
-            return None
-    return None
+    key = _summarizer_cache_key_parts(summarizer)
+    try:
+        text = _cache_db_fetch(
+            "SELECT text FROM summaries WHERE video_id = ? AND summarizer = ?", (video_id, key)
+        )
+        if text is None:
+            # Fall back to (and migrate) summaries cached by older versions
+            text = _load_legacy_cache_file(get_summary_cache_path(video_id, summarizer))
+            if text is None:
+                return None
+            _cache_db_write(
+                "INSERT OR REPLACE INTO summaries (video_id, summarizer, text) VALUES (?, ?, ?)",
+                (video_id, key, text),
+            )
+        print(f"Using cached summary for video {video_id}")
+        return text
+    except Exception as e:
+        print(f"Error loading summary cache for {video_id}: {e}")
+        return None
 
 
 def save_summary_cache(video_id: str, summarizer: Summarizer, summary: str) -> None:
     """Save summary for a video/summarizer combo to cache."""
-    cache_path = get_summary_cache_path(video_id, summarizer)
+    key = _summarizer_cache_key_parts(summarizer)
     try:
-        cache_path.write_text(summary, encoding="utf-8")
-        print(f"Cached summary for video {video_id} to {cache_path}")
+        _cache_db_write(
+            "INSERT OR REPLACE INTO summaries (video_id, summarizer, text) VALUES (?, ?, ?)",
+            (video_id, key, summary),
+        )
+        print(f"Cached summary for video {video_id}")
     except Exception as e:
         print(f"Error saving summary cache for {video_id}: {e}")
 
 
+async def save_summary_cache_async(video_id: str, summarizer: Summarizer, summary: str) -> None:
+    """Save a summary to cache from a coroutine without blocking the event loop."""
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, lambda: save_summary_cache(video_id, summarizer, summary))
+
+
 def extract_video_id(url: str) -> str:
     """Extract video ID from YouTube URL."""
     parsed = urlparse(url)
@@ -190,12 +284,35 @@ async def download_subtitles(video_id: str, proxy: bool = False) -> Optional[str
     return await loop.run_in_executor(None, lambda: _download_subtitles_sync(video_id, proxy))
 
 
+def _is_too_short(duration: Optional[int]) -> bool:
+    """Whether a video is too short (under 2 minutes) to be worth summarizing."""
+    return bool(duration) and 0 < duration < 120
+
+
+def _cached_summary(video_id: str, title: str, summarizer: Summarizer, use_summary_cache: bool) -> Optional[str]:
+    """Look up a previously generated summary when summary caching is enabled."""
+    if not use_summary_cache:
+        return None
+    summary = load_summary_cache(video_id, summarizer)
+    if summary is not None:
+        print(f"Reusing cached summary for: {title}")
+    return summary
+
+
+async def _generate_summary(video_id: str, title: str, subtitles: Optional[str], summarizer: Summarizer) -> str:
+    """Summarize subtitles and cache the result (empty summary when there are no subtitles)."""
+    if not subtitles:
+        return ""
+    print(f"Generating summary for: {title}")
+    summary = await summarizer.summarize(subtitles, title)
+    await save_summary_cache_async(video_id, summarizer, summary)
+    return summary
 
 
 async def process_video(video_url: str, index: int, title: str, summarizer: Summarizer, duration: int = 0, speakers: Optional[str] = None, sched_link: Optional[str] = None, use_summary_cache: bool = True, proxy: bool = False, sleep: int = 0) -> Optional[Dict]:
     """Process a single video: check duration, download subtitles, and summarize."""
     # Check duration
-    if duration > 0 and duration < 120:  # Less than 2 minutes
+    if _is_too_short(duration):
         print(f"Skipping {title} (duration: {duration}s)")
         return None
     
@@ -205,32 +322,20 @@ async def process_video(video_url: str, index: int, title: str, summarizer: Summ
     except ValueError as e:
         print(f"Error: {e}")
         return None
-    
-    # Optionally sleep before fetching subtitles to avoid hammering YouTube
-    if sleep and sleep > 0:
-        await asyncio.sleep(sleep)
 
-    # Download subtitles
-    subtitles = await download_subtitles(video_id, proxy=proxy)
-    if not subtitles:
-        print(f"No subtitles available for {title}")
+    # A cached summary makes the subtitle download unnecessary
+    summary = _cached_summary(video_id, title, summarizer, use_summary_cache)
+    if summary is None:
+        # Optionally sleep before fetching subtitles to avoid hammering YouTube
+        if sleep and sleep > 0:
+            await asyncio.sleep(sleep)
 
-    # Try to load summary from cache first (when enabled), even if subtitles are missing
-    summary: Optional[str] = None
-    if use_summary_cache:
-        summary = load_summary_cache(video_id, summarizer)
-        if summary is not None:
-            print(f"Reusing cached summary for: {title}")
+        subtitles = await download_subtitles(video_id, proxy=proxy)
+        if not subtitles:
+            print(f"No subtitles available for {title}")
 
-    # Only attempt to generate a new summary when we have subtitles
-    if summary is None:
-        if subtitles:
-            print(f"Generating summary for: {title}")
-            summary = await summarizer.summarize(subtitles, title)
-            save_summary_cache(video_id, summarizer, summary)
-        else:
-            # Include the video with an empty summary when subtitles are unavailable
-            summary = ""
+        # Include the video with an empty summary when subtitles are unavailable
+        summary = await _generate_summary(video_id, title, subtitles, summarizer)
     
     result = {
         "index": index,
@@ -247,7 +352,7 @@ async def process_video(video_url: str, index: int, title: str, summarizer: Summ
     return result
 
 
-async def process_playlist(playlist_url: str, summarizer: Optional[Summarizer] = None, limit: Optional[int] = None, refresh_cache: bool = False, use_summary_cache: bool = True, proxy: bool = False, sleep: int = 0) -> Dict[str, Dict]:
+async def process_playlist(playlist_url: str, summarizer: Optional[Summarizer] = None, limit: Optional[int] = None, refresh_cache: bool = False, use_summary_cache: bool = True, proxy: bool = False, sleep: int = 0, concurrency: int = 10, summary_concurrency: int = 8) -> Dict[str, Dict]:
     """
     Process a YouTube playlist: download subtitles and generate summaries.
     
@@ -256,12 +361,12 @@ async def process_playlist(playlist_url: str, summarizer: Optional[Summarizer] =
         summarizer: Summarizer instance to use (defaults to OpenAISummarizer)
         limit: Maximum number of videos to process (None for all videos)
         refresh_cache: Force refresh playlist data from YouTube (ignore cache)
+        concurrency: Maximum number of subtitle downloads in flight at once
+        summary_concurrency: Maximum number of summaries generated at once
         
     Returns:
         Dictionary mapping video URLs to their metadata (index, title, summary)
     """
-    import yt_dlp
-    
     print(f"Processing playlist: {playlist_url}")
     
     # Use default summarizer if none provided
@@ -323,18 +428,23 @@ async def process_playlist(playlist_url: str, summarizer: Optional[Summarizer] =
         query_params = parse_qs(parsed.query)
         playlist_id = query_params.get('list', [None])[0]
     
-    # Phase 1: fetch subtitles (transcripts) for all eligible videos
-    prepared: List[Dict] = []
+    # Skip very short videos up front; indices still refer to playlist positions
+    eligible = []
     for idx, video_info in enumerate(videos, start=1):
+        if _is_too_short(video_info['duration']):
+            print(f"Skipping {video_info['title']} (duration: {video_info['duration']}s)")
+        else:
+            eligible.append((idx, video_info))
+
+    # Phase 1: fetch subtitles (transcripts) for all eligible videos concurrently,
+    # bounded by a semaphore so we don't open too many requests to YouTube at once
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_one(idx: int, video_info: Dict) -> Optional[Dict]:
         video_url = video_info['url']
         title = video_info['title']
         duration = video_info['duration']
 
-        # Skip very short videos
-        if duration > 0 and duration < 120:  # Less than 2 minutes
-            print(f"Skipping {title} (duration: {duration}s)")
-            continue
-
         # Construct URL with index parameter (for linking back to playlist)
         if playlist_id:
             indexed_url = f"{video_url}&list={playlist_id}&index={idx}"
@@ -346,58 +456,55 @@ async def process_playlist(playlist_url: str, summarizer: Optional[Summarizer] =
             video_id = extract_video_id(video_url)
         except ValueError as e:
             print(f"Error: {e}")
-            continue
+            return None
 
-        # Optionally sleep before fetching subtitles to avoid hammering YouTube
-        if sleep and sleep > 0:
-            await asyncio.sleep(sleep)
+        item = {
+            "index": idx,
+            "video_url": video_url,
+            "indexed_url": indexed_url,
+            "title": title,
+            "duration": duration,
+            "video_id": video_id,
+            "subtitles": "",
+            # Cache lookups happen up front so cached videos skip the download entirely
+            "summary": _cached_summary(video_id, title, summarizer, use_summary_cache),
+        }
+        if item["summary"] is not None:
+            return item
 
-        subtitles = await download_subtitles(video_id, proxy=proxy)
-        if not subtitles:
-            print(f"No subtitles available for {title}")
+        async with sem:
+            # Optionally sleep before fetching subtitles to avoid hammering YouTube
+            if sleep and sleep > 0:
+                await asyncio.sleep(sleep)
+
+            subtitles = await download_subtitles(video_id, proxy=proxy)
+
+        if subtitles:
+            item["subtitles"] = subtitles
+        else:
             # We still include the video; summary generation will be skipped later
-            subtitles = ""
-
-        prepared.append(
-            {
-                "index": idx,
-                "video_url": video_url,
-                "indexed_url": indexed_url,
-                "title": title,
-                "duration": duration,
-                "video_id": video_id,
-                "subtitles": subtitles,
-            }
-        )
+            print(f"No subtitles available for {title}")
+        return item
+
+    results = await asyncio.gather(*[fetch_one(idx, video_info) for idx, video_info in eligible])
+    prepared: List[Dict] = [r for r in results if r is not None]
+
+    # Phase 2: generate summaries once all subtitles are available. Cached
+    # summaries were resolved in Phase 1; only cache misses hit the summarizer.
+    summary_sem = asyncio.Semaphore(max(1, summary_concurrency))
+
+    async def bounded_summarize(item: Dict) -> None:
+        async with summary_sem:
+            item["summary"] = await _generate_summary(item["video_id"], item["title"], item["subtitles"], summarizer)
+
+    await asyncio.gather(*[bounded_summarize(item) for item in prepared if item["summary"] is None])
 
-    # Phase 2: generate/load summaries once all subtitles are available
     output: Dict[str, Dict] = {}
     for item in prepared:
-        idx = item["index"]
-        indexed_url = item["indexed_url"]
-        title = item["title"]
-        video_id = item["video_id"]
-        subtitles = item["subtitles"]
-
-        summary: Optional[str] = None
-        if use_summary_cache:
-            summary = load_summary_cache(video_id, summarizer)
-            if summary is not None:
-                print(f"Reusing cached summary for: {title}")
-
-        if summary is None:
-            if subtitles:
-                print(f"Generating summary for: {title}")
-                summary = await summarizer.summarize(subtitles, title)
-                save_summary_cache(video_id, summarizer, summary)
-            else:
-                # No subtitles and no cached summary: include video with blank summary
-                summary = ""
-
-        output[indexed_url] = {
-            "index": idx,
-            "title": title,
-            "summary": summary,
+        output[item["indexed_url"]] = {
+            "index": item["index"],
+            "title": item["title"],
+            "summary": item["summary"],
         }
 
     return output
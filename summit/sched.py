@@ -1,17 +1,57 @@
 """Sched.com scraping and processing utilities for Summit."""
 
 import asyncio
-import json
 import re
+import string
+from email.utils import parsedate_to_datetime
+from time import time
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
 
-from .core import get_cache_dir, process_video
+from .core import get_cache_dir, json_dumps, json_loads, process_video
+from .sched_cache import load_talk, save_talk
 from .summarizers import Summarizer, get_summarizer
 
+# lxml's C parser is much faster than the pure-Python html.parser on the large
+# sched.com index page; fall back to html.parser if it is not installed
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
+# Patterns used for every page fetched, compiled once
+_SAFE_FILE_RE = re.compile(r"[^A-Za-z0-9._-]")
+# Byte-level equivalent of _SAFE_FILE_RE for ASCII input: every byte outside
+# the allowed set maps to "_"
+_SAFE_FILE_CHARS = set((string.ascii_letters + string.digits + "._-").encode("ascii"))
+_SAFE_FILE_TABLE = bytes(b if b in _SAFE_FILE_CHARS else ord("_") for b in range(256))
+_YT_EMBED_RE = re.compile(r"youtube\.com/embed/([^?&/]+)")
+_EVENT_HREF_RE = re.compile(r"/event/")
+_CONTAINER_CLASS_RE = re.compile(r"sched-container-inner|event-container")
+_EVENTISH_CLASS_RE = re.compile(r"event|session|talk")
+
+# The index page is only searched for event containers (divs) and event links,
+# so only those tags (with everything nested inside them) are built into the tree
+_INDEX_STRAINER = SoupStrainer(["a", "div"])
+
+# Cap on requests in flight to sched.com across all concurrent fetches of one
+# scrape, so open sockets (and file descriptors) stay bounded
+_MAX_IN_FLIGHT = 32
+
+# Attempts per request for rate limits (429), server errors (5xx) and network errors
+_MAX_FETCH_ATTEMPTS = 4
+_MAX_BACKOFF = 30.0
+
+# Detail responses that will never turn into a talk page, so are not retried
+_GONE_STATUSES = frozenset({403, 404, 410})
+# Present on a talk page even before its title has rendered
+_TALK_PAGE_MARKER = "sched-container"
+
 
 def _safe_filename_from_url(url: str) -> str:
     """Create a filesystem-safe filename based on a URL."""
@@ -20,9 +60,11 @@ def _safe_filename_from_url(url: str) -> str:
     base = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
     if parsed.query:
         base += f"?{parsed.query}"
-    # Replace any characters that are not safe for filenames
-    safe = re.sub(r"[^A-Za-z0-9._-]", "_", base)
-    return safe
+    # Replace any characters that are not safe for filenames. bytes.translate
+    # is several times faster than the regex, but only maps ASCII one-to-one.
+    if base.isascii():
+        return base.encode("ascii").translate(_SAFE_FILE_TABLE).decode("ascii")
+    return _SAFE_FILE_RE.sub("_", base)
 
 
 def get_sched_cache_path(sched_url: str):
@@ -34,143 +76,286 @@ def get_sched_cache_path(sched_url: str):
 def load_sched_cache(sched_url: str) -> Optional[List[Dict]]:
     """Load cached sched talks if available."""
     cache_path = get_sched_cache_path(sched_url)
-    if cache_path.exists():
-        try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
-                print(f"Using cached sched data from {cache_path}")
-                return data
-        except Exception as e:
-            print(f"Error loading sched cache: {e}")
-            return None
-    return None
+    try:
+        with open(cache_path, "rb") as f:
+            data = json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading sched cache: {e}")
+        return None
+    print(f"Using cached sched data from {cache_path}")
+    return data
 
 
 def save_sched_cache(sched_url: str, talks: List[Dict]) -> None:
     """Save sched talks to cache."""
     cache_path = get_sched_cache_path(sched_url)
     try:
-        with open(cache_path, "w") as f:
-            json.dump(talks, f, indent=2)
+        # orjson (when installed) serializes straight to bytes, so write in binary mode
+        with open(cache_path, "wb") as f:
+            f.write(json_dumps(talks, indent=True))
         print(f"Cached sched data to {cache_path}")
     except Exception as e:
         print(f"Error saving sched cache: {e}")
 
 
-async def _fetch_talk_detail(sched_link: str) -> Optional[Dict]:
-    """Fetch a single talk's detail page to extract title, description, and YouTube link."""
+# Every element _fetch_talk_detail reads, matched in a single pass over the detail page
+_DETAIL_SELECTOR = (
+    '.name, .tip-description, .sched-event-type, '
+    'a[href*="youtube.com/watch"], a[href*="youtu.be/"], '
+    'iframe[src*="youtube.com/embed/"], div.sched-file'
+)
+
+
+def _first_detail_nodes(tree: LexborHTMLParser) -> Dict:
+    """Bucket the first node of each kind the detail-page extraction needs.
+
+    One CSS query walks the document once (in document order) instead of one
+    walk per lookup; a node can fill more than one bucket.
+    """
+    found: Dict = {}
+    for node in tree.css(_DETAIL_SELECTOR):
+        attrs = node.attributes
+        classes = (attrs.get('class') or '').split()
+        tag = node.tag
+        if 'name' in classes:
+            found.setdefault('name', node)
+        if 'tip-description' in classes:
+            found.setdefault('description', node)
+        if 'sched-event-type' in classes:
+            found.setdefault('event_type', node)
+        if tag == 'a':
+            href = attrs.get('href') or ''
+            if 'youtube.com/watch' in href or 'youtu.be/' in href:
+                found.setdefault('youtube_link', node)
+        elif tag == 'iframe':
+            if 'youtube.com/embed/' in (attrs.get('src') or ''):
+                found.setdefault('youtube_iframe', node)
+        elif tag == 'div' and 'sched-file' in classes:
+            found.setdefault('deck', node)
+    return found
+
+
+def _parse_talk_detail(html_text: str, sched_link: str) -> Optional[Dict]:
+    """Extract the talk fields from a detail page's HTML.
+
+    Returns None when the page has no title element yet; youtube_url is None
+    when the page has no YouTube link or embed. This is pure CPU work and is
+    run off the event loop by _fetch_talk_detail.
+    """
+    # Detail pages are parsed hundreds of times per run, so use selectolax:
+    # all of the lookups below run as CSS selection in C against a Lexbor DOM
+    nodes = _first_detail_nodes(LexborHTMLParser(html_text))
+
+    title_elem = nodes.get('name')
+    if title_elem is None:
+        return None
+
+    # The full title includes both talk title and speakers
+    title = title_elem.text(strip=True)
+
+    # Extract description from element with class "tip-description" if present
+    description_elem = nodes.get('description')
+    description = description_elem.text(strip=True) if description_elem is not None else ""
+
+    # Extract event type from element with class "sched-event-type" if present
+    event_type = None
+    event_type_elem = nodes.get('event_type')
+    if event_type_elem is not None:
+        # The event type is in the FIRST direct child <a> of this div
+        # (there may also be an unordered list with extra links we should ignore).
+        first_anchor = next((child for child in event_type_elem.iter() if child.tag == 'a'), None)
+        if first_anchor is not None:
+            event_type = first_anchor.text(strip=True) or None
+
+    # Look for YouTube links in detail page
+    youtube_url = None
+    youtube_link = nodes.get('youtube_link')
+    if youtube_link is not None:
+        youtube_url = youtube_link.attributes.get('href')
+
+    # Also check for embedded YouTube iframes
+    if not youtube_url:
+        youtube_iframe = nodes.get('youtube_iframe')
+        if youtube_iframe is not None:
+            iframe_src = youtube_iframe.attributes.get('src') or ""
+            # Extract video ID from embed URL and construct watch URL
+            video_id_match = _YT_EMBED_RE.search(iframe_src)
+            if video_id_match:
+                youtube_url = f"https://www.youtube.com/watch?v={video_id_match.group(1)}"
+
+    # Look for an attached deck in div.sched-file (first anchor)
+    deck_url = None
+    deck_container = nodes.get('deck')
+    if deck_container is not None:
+        deck_anchor = deck_container.css_first('a[href]')
+        if deck_anchor is not None:
+            href = deck_anchor.attributes.get('href')
+            if href and not href.startswith('http'):
+                base_url = '/'.join(sched_link.split('/')[:3])
+                href = base_url + href
+            deck_url = href
+
+    return {
+        'title': title,
+        'sched_link': sched_link,
+        'youtube_url': youtube_url,
+        'description': description,
+        'event_type': event_type,
+        'deck_url': deck_url,
+    }
+
+
+async def _fetch_talk_detail(sched_link: str, client: httpx.AsyncClient, slots: asyncio.BoundedSemaphore, refresh: bool = False, sleep: int = 0) -> Optional[Dict]:
+    """Fetch a single talk's detail page to extract title, description, and YouTube link.
+
+    Talks already cached with a YouTube video are returned without a request
+    unless refresh is set; anything else is revalidated against its cached copy.
+    Each request actually sent is followed by a pause of sleep seconds.
+    """
     try:
         loop = asyncio.get_event_loop()
 
         # In case Sched renders parts of the page slowly, retry a few times
         max_attempts = 3
-        detail_soup = None
-        title_elem = None
+        parsed = None
+
+        cached = load_talk(sched_link)
+        if cached and cached["payload"] is not None and not refresh:
+            return cached["payload"]
+
+        # Revalidate against the last seen copy so unchanged pages come back as
+        # an empty 304 and skip both the download and the parse. Talks cached
+        # without a video are always revalidated, since recordings are often
+        # attached to the schedule after the event.
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
         for attempt in range(1, max_attempts + 1):
-            # Run requests.get in thread pool to avoid blocking
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(sched_link, timeout=15)
-            )
-
-            detail_soup = BeautifulSoup(response.text, 'html.parser')
-            title_elem = detail_soup.find(class_='name')
+            response = await _sched_get(client, slots, sched_link, headers=headers)
+            # Throttle real requests only; cache hits above send nothing
+            if sleep and sleep > 0:
+                await asyncio.sleep(sleep)
+            if response.status_code == 304 and cached:
+                print(f"Detail page unchanged, using cache for {sched_link}")
+                return cached["payload"]
+            if response.status_code in _GONE_STATUSES:
+                print(f"Skipping {sched_link}: sched.com returned {response.status_code}")
+                return None
+
+            # Parse in the default thread pool so other fetches keep flowing
+            # while this page's HTML is being processed
+            parsed = await loop.run_in_executor(None, _parse_talk_detail, response.text, sched_link)
+
+            if parsed is not None:
+                break
 
-            if title_elem:
+            # Only a talk page that rendered without its title is worth fetching
+            # again; anything else (error, sponsor or landing page) never gains one
+            if response.status_code != 200 or _TALK_PAGE_MARKER not in response.text:
                 break
 
             if attempt < max_attempts:
-                # Wait briefly before retrying to give the page a chance to fully render
-                await asyncio.sleep(1.0)
+                # Back off before retrying to give the page a chance to fully render
+                await asyncio.sleep(2.0 ** (attempt - 1))
 
-        if not title_elem:
-            print(f"Could not find title element with class 'name' in {sched_link} after {max_attempts} attempts")
+        if parsed is None:
+            print(f"Could not find title element with class 'name' in {sched_link} after {attempt} attempt(s)")
             return None
 
-        # The full title includes both talk title and speakers
-        title = title_elem.get_text(strip=True)
-
+        title = parsed['title']
         print(f"Fetching detail page for: {title}")
 
-        # Extract description from element with class "tip-description" if present
-        description_elem = detail_soup.find(class_='tip-description')
-        description = description_elem.get_text(strip=True) if description_elem else ""
-
-        # Extract event type from element with class "sched-event-type" if present
-        event_type_elem = detail_soup.find(class_='sched-event-type')
-        if event_type_elem:
-            # The event type is in the FIRST direct child <a> of this div
-            # (there may also be an unordered list with extra links we should ignore).
-            first_anchor = None
-            for child in event_type_elem.children:
-                if getattr(child, 'name', None) == 'a':
-                    first_anchor = child
-                    break
-
-            if first_anchor is not None:
-                text = first_anchor.get_text(strip=True)
-                event_type = text if text else None
-            else:
-                event_type = None
-        else:
-            event_type = None
-        
-        # Look for YouTube links in detail page
-        youtube_links = detail_soup.find_all('a', href=re.compile(r'youtube\.com/watch|youtu\.be/'))
-        youtube_url = None
-        
-        if youtube_links:
-            youtube_url = youtube_links[0].get('href')
-        
-        # Also check for embedded YouTube iframes
-        if not youtube_url:
-            youtube_iframes = detail_soup.find_all('iframe', src=re.compile(r'youtube\.com/embed/'))
-            if youtube_iframes:
-                iframe_src = youtube_iframes[0].get('src')
-                # Extract video ID from embed URL and construct watch URL
-                video_id_match = re.search(r'youtube\.com/embed/([^?&/]+)', iframe_src)
-                if video_id_match:
-                    youtube_url = f"https://www.youtube.com/watch?v={video_id_match.group(1)}"
-        
-        # Look for an attached deck in div.sched-file (first anchor)
-        deck_url = None
-        deck_container = detail_soup.find('div', class_='sched-file')
-        if deck_container:
-            deck_anchor = deck_container.find('a', href=True)
-            if deck_anchor:
-                href = deck_anchor['href']
-                if href and not href.startswith('http'):
-                    base_url = '/'.join(sched_link.split('/')[:3])
-                    href = base_url + href
-                deck_url = href
-
-        if youtube_url:
+        talk = None
+        if parsed['youtube_url']:
             print(f"Found YouTube video for: {title}")
-            return {
-                'title': title,
-                'sched_link': sched_link,
-                'youtube_url': youtube_url,
-                'description': description,
-                'event_type': event_type,
-                'deck_url': deck_url,
-            }
+            talk = parsed
         else:
             print(f"Skipping (no YouTube video): {title}")
-            return None
-            
+
+        save_talk(sched_link, talk, response.headers.get("etag"), response.headers.get("last-modified"))
+        return talk
+
     except Exception as e:
         print(f"Could not fetch detail page for {sched_link}: {e}")
         return None
 
 
-async def scrape_sched_talks_async(sched_url: str, limit: Optional[int] = None, sleep: int = 0, offset: int = 0) -> List[Dict]:
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring Retry-After when the server sends it."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(_MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            try:
+                return min(_MAX_BACKOFF, max(0.0, parsedate_to_datetime(retry_after).timestamp() - time()))
+            except (TypeError, ValueError):
+                pass
+    return min(_MAX_BACKOFF, 2.0 ** attempt)
+
+
+async def _sched_get(client: httpx.AsyncClient, slots: asyncio.BoundedSemaphore, url: str, **kwargs) -> httpx.Response:
+    """GET a sched.com page, retrying 429/5xx and network errors with exponential backoff.
+
+    The final response is returned as-is once attempts run out; the last
+    network error is re-raised.
+    """
+    for attempt in range(_MAX_FETCH_ATTEMPTS):
+        last_attempt = attempt == _MAX_FETCH_ATTEMPTS - 1
+        try:
+            async with slots:
+                response = await client.get(url, **kwargs)
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            if last_attempt:
+                raise
+            delay = min(_MAX_BACKOFF, 2.0 ** attempt)
+            print(f"Request to {url} failed ({e}), retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        if (response.status_code == 429 or response.status_code >= 500) and not last_attempt:
+            delay = _retry_delay(response, attempt)
+            print(f"sched.com returned {response.status_code} for {url}, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            continue
+        return response
+
+
+def _sched_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by the index and detail page fetches."""
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=httpx.Timeout(15.0),
+    )
+
+
+async def scrape_sched_talks_async(sched_url: str, limit: Optional[int] = None, sleep: int = 0, offset: int = 0, concurrency: int = 16, refresh: bool = False) -> List[Dict]:
     """Scrape talks from a sched.com event page (async version).
 
     The offset parameter controls how many initial schedule entries are skipped
     **without** fetching their detail pages, to avoid unnecessary requests
-    when the user only cares about talks after a certain point.
+    when the user only cares about talks after a certain point. Up to
+    concurrency detail pages are fetched at once. Talks found in the per-talk
+    cache are reused unless refresh is set.
     """
+    # One client for the whole scrape so every request to sched.com reuses
+    # pooled keep-alive connections instead of a fresh TCP+TLS handshake.
+    # The in-flight cap is created here too, so it belongs to this scrape's loop.
+    slots = asyncio.BoundedSemaphore(_MAX_IN_FLIGHT)
+    async with _sched_client() as client:
+        return await _scrape_sched_talks(client, slots, sched_url, limit, sleep, offset, concurrency, refresh)
+
+
+async def _scrape_sched_talks(client: httpx.AsyncClient, slots: asyncio.BoundedSemaphore, sched_url: str, limit: Optional[int], sleep: int, offset: int, concurrency: int, refresh: bool) -> List[Dict]:
+    """Scrape talks from a sched.com event page using the given client."""
     # Ensure URL has /list/descriptions path
     if '/list/descriptions' not in sched_url:
         # Parse the URL and add the path
@@ -181,38 +366,36 @@ async def scrape_sched_talks_async(sched_url: str, limit: Optional[int] = None,
     print(f"Scraping talks from {sched_url}...")
     
     try:
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: requests.get(sched_url, timeout=30)
-        )
+        response = await _sched_get(client, slots, sched_url, timeout=30)
         response.raise_for_status()
     except Exception as e:
         print(f"Error fetching sched.com page: {e}")
         return []
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, _BS_PARSER, parse_only=_INDEX_STRAINER)
     
     # Find all event items - sched.com uses various class names, we'll try common patterns
     # Look for event containers
-    event_items = soup.find_all('div', class_=re.compile(r'sched-container-inner|event-container'))
+    event_items = soup.find_all('div', class_=_CONTAINER_CLASS_RE)
     
     if not event_items:
         # Try alternative structure - look for links with event info
-        event_items = soup.find_all('a', href=re.compile(r'/event/'))
+        event_items = soup.find_all('a', href=_EVENT_HREF_RE)
     
     if not event_items:
         # Try even broader search - any div with event-related classes
-        event_items = soup.find_all('div', class_=re.compile(r'event|session|talk'))
+        event_items = soup.find_all('div', class_=_EVENTISH_CLASS_RE)
     
     print(f"Found {len(event_items)} potential event items to parse")
     
-    # Extract sched links from all items first
+    # Extract sched links from all items first. The same talk can appear in
+    # several views of the schedule, so keep only its first occurrence.
+    seen = set()
     sched_links = []
     for item in event_items:
         try:
             # Extract sched link
-            link_elem = item.find('a', href=re.compile(r'/event/'))
+            link_elem = item.find('a', href=_EVENT_HREF_RE)
             if not link_elem:
                 continue
             
@@ -221,35 +404,43 @@ async def scrape_sched_talks_async(sched_url: str, limit: Optional[int] = None,
                 # Make absolute URL
                 base_url = '/'.join(sched_url.split('/')[:3])
                 sched_link = base_url + sched_link
-            
-            sched_links.append(sched_link)
+
+            if sched_link not in seen:
+                seen.add(sched_link)
+                sched_links.append(sched_link)
         except Exception as e:
             print(f"Error parsing event item: {e}")
             continue
     
-    # Fetch detail pages sequentially to better control request rate
-    print(f"Fetching detail pages for {len(sched_links)} talks...")
-    talks: List[Dict] = []
-    current_offset = offset if offset and offset > 0 else 0
-
-    for idx, link in enumerate(sched_links, start=1):
-        # If an offset is specified, skip issuing detail requests for the
-        # first N schedule entries entirely.
-        if current_offset > 0:
-            current_offset -= 1
-            continue
+    # If an offset is specified, skip issuing detail requests for the
+    # first N schedule entries entirely.
+    if offset and offset > 0:
+        sched_links = sched_links[offset:]
 
-        talk = await _fetch_talk_detail(link)
-        if talk is not None:
-            talks.append(talk)
+    # Fetch detail pages concurrently, bounded so sched.com is not flooded
+    print(f"Fetching detail pages for {len(sched_links)} talks...")
+    sem = asyncio.Semaphore(max(1, concurrency))
 
-        # Apply limit early if we've collected enough talks with YouTube videos
-        if limit and len(talks) >= limit:
-            break
+    async def bounded_fetch(link: str) -> Optional[Dict]:
+        async with sem:
+            # --sleep is applied inside the slot, after each request sent
+            return await _fetch_talk_detail(link, client, slots, refresh, sleep)
 
-        # Sleep between requests if configured
-        if sleep and sleep > 0:
-            await asyncio.sleep(sleep)
+    tasks = [asyncio.ensure_future(bounded_fetch(link)) for link in sched_links]
+    talks: List[Dict] = []
+    try:
+        # Collect in schedule order so talk indices stay stable across runs
+        for task in tasks:
+            talk = await task
+            if talk is not None:
+                talks.append(talk)
+
+            # Apply limit early if we've collected enough talks with YouTube videos
+            if limit and len(talks) >= limit:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
 
     if limit and len(talks) > limit:
         talks = talks[:limit]
@@ -259,12 +450,12 @@ async def scrape_sched_talks_async(sched_url: str, limit: Optional[int] = None,
     return talks
 
 
-def scrape_sched_talks(sched_url: str, limit: Optional[int] = None, sleep: int = 0, offset: int = 0) -> List[Dict]:
+def scrape_sched_talks(sched_url: str, limit: Optional[int] = None, sleep: int = 0, offset: int = 0, concurrency: int = 16, refresh: bool = False) -> List[Dict]:
     """Scrape talks from a sched.com event page (sync wrapper)."""
-    return asyncio.run(scrape_sched_talks_async(sched_url, limit, sleep, offset))
+    return asyncio.run(scrape_sched_talks_async(sched_url, limit, sleep, offset, concurrency, refresh))
 
 
-async def process_sched_talks(sched_url: str, summarizer: Optional[Summarizer] = None, limit: Optional[int] = None, refresh_cache: bool = False, summarize: bool = True, offset: int = 0, sleep: int = 0, use_summary_cache: bool = True, proxy: bool = False) -> Dict[str, Dict]:
+async def process_sched_talks(sched_url: str, summarizer: Optional[Summarizer] = None, limit: Optional[int] = None, refresh_cache: bool = False, summarize: bool = True, offset: int = 0, sleep: int = 0, use_summary_cache: bool = True, proxy: bool = False, sched_concurrency: int = 16, summary_concurrency: int = 8) -> Dict[str, Dict]:
     """Process talks from a sched.com event page."""
     print(f"Processing sched.com event: {sched_url}")
     
@@ -289,7 +480,7 @@ async def process_sched_talks(sched_url: str, summarizer: Optional[Summarizer] =
         if limit is not None and limit > 0:
             fetch_limit = limit
 
-        talks = await scrape_sched_talks_async(sched_url, limit=fetch_limit, sleep=sleep, offset=offset)
+        talks = await scrape_sched_talks_async(sched_url, limit=fetch_limit, sleep=sleep, offset=offset, concurrency=sched_concurrency, refresh=refresh_cache)
 
         # Save to cache only when we are not using an offset, so the cache
         # always represents the full un-offset set of talks.
@@ -338,20 +529,26 @@ async def process_sched_talks(sched_url: str, summarizer: Optional[Summarizer] =
 
     print(f"Processing {len(talks)} talks with summarization...")
 
-    # Process talks asynchronously using the summarizer
-    tasks = []
-    for idx, talk in enumerate(talks, start=1):
-        tasks.append(process_video(
-            video_url=talk['youtube_url'],
-            index=idx,
-            title=talk['title'],
-            summarizer=summarizer,
-            speakers=None,  # Speakers are included in the title
-            sched_link=talk['sched_link'],
-            use_summary_cache=use_summary_cache,
-            proxy=proxy,
-            sleep=sleep,
-        ))
+    # Process talks asynchronously using the summarizer, with a bounded number
+    # in flight so a large schedule does not fire every LLM request at once.
+    # Per-provider request rates are throttled by the summarizer's --rpm limiter.
+    sem = asyncio.Semaphore(max(1, summary_concurrency))
+
+    async def bounded_process(idx: int, talk: Dict) -> Optional[Dict]:
+        async with sem:
+            return await process_video(
+                video_url=talk['youtube_url'],
+                index=idx,
+                title=talk['title'],
+                summarizer=summarizer,
+                speakers=None,  # Speakers are included in the title
+                sched_link=talk['sched_link'],
+                use_summary_cache=use_summary_cache,
+                proxy=proxy,
+                sleep=sleep,
+            )
+
+    tasks = [bounded_process(idx, talk) for idx, talk in enumerate(talks, start=1)]
 
     # Wait for all tasks to complete
     results = await asyncio.gather(*tasks)
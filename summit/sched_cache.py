@@ -0,0 +1,75 @@
+"""Per-talk SQLite cache for sched.com detail pages."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .core import get_cache_dir, json_dumps, json_loads
+
+_db: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()
+
+
+def get_sched_db_path() -> Path:
+    """Get the path of the SQLite database holding parsed sched.com talks."""
+    return get_cache_dir() / 'sched.db'
+
+
+def _get_db() -> sqlite3.Connection:
+    """Open the talk cache database on first use. Callers must hold _db_lock."""
+    global _db
+    if _db is None:
+        conn = sqlite3.connect(str(get_sched_db_path()), isolation_level=None, check_same_thread=False)
+        # WAL lets several scrapers read and write the cache at the same time
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS talks ("
+            "sched_link TEXT PRIMARY KEY, fetched_at REAL NOT NULL, "
+            "etag TEXT, last_modified TEXT, payload BLOB NOT NULL)"
+        )
+        _db = conn
+    return _db
+
+
+def load_talk(sched_link: str) -> Optional[Dict]:
+    """Load the cached entry for a talk's detail page.
+
+    Returns a dict with fetched_at, etag, last_modified and payload (the
+    parsed talk, or None when the page had no YouTube video), or None on a miss.
+    """
+    try:
+        with _db_lock:
+            row = _get_db().execute(
+                "SELECT fetched_at, etag, last_modified, payload FROM talks WHERE sched_link = ?",
+                (sched_link,),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, etag, last_modified, payload = row
+        talk = json_loads(payload)
+    except Exception as e:
+        # Unreadable or corrupt rows are treated as a miss and refetched
+        print(f"Error loading talk cache for {sched_link}: {e}")
+        return None
+    return {
+        "fetched_at": fetched_at,
+        "etag": etag,
+        "last_modified": last_modified,
+        "payload": talk,
+    }
+
+
+def save_talk(sched_link: str, payload: Optional[Dict], etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+    """Save a talk's parsed detail page along with its HTTP validators."""
+    try:
+        with _db_lock:
+            _get_db().execute(
+                "INSERT OR REPLACE INTO talks (sched_link, fetched_at, etag, last_modified, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (sched_link, time.time(), etag, last_modified, json_dumps(payload)),
+            )
+    except Exception as e:
+        print(f"Error saving talk cache for {sched_link}: {e}")
@@ -1,14 +1,176 @@
 """Pluggable summarization strategies for Summit."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 import os
 import asyncio
 import httpx
 
+try:
+    import tiktoken
+except ImportError:  # tiktoken is optional; fall back to a character budget
+    tiktoken = None
+
+# Default upper bound on pooled HTTP connections per summarizer
+DEFAULT_MAX_CONNECTIONS = 64
+
+
+def _http_limits(max_connections: int) -> httpx.Limits:
+    """Connection pool limits shared by the httpx-based summarizer clients."""
+    return httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+
+
+# Pooled Ollama clients shared by every OllamaSummarizer, keyed by (base_url, max_connections).
+# Each client is stored with the event loop it was created on: its keep-alive
+# connections belong to that loop and cannot be used from another one.
+_OLLAMA_CLIENTS: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _get_ollama_client(base_url: str, max_connections: int = DEFAULT_MAX_CONNECTIONS) -> httpx.AsyncClient:
+    """Return the shared client for an Ollama server on the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    key = (base_url, max_connections)
+    entry = _OLLAMA_CLIENTS.get(key)
+    if entry is not None:
+        client_loop, client = entry
+        if client_loop is loop and not client.is_closed:
+            return client
+        # Left over from an earlier event loop (e.g. a previous asyncio.run);
+        # its connections are unusable here, so start a fresh pool
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(60.0),
+        http2=True,
+        limits=_http_limits(max_connections),
+    )
+    _OLLAMA_CLIENTS[key] = (loop, client)
+    return client
+
+
+async def aclose_all() -> None:
+    """Close the shared summarizer HTTP clients created on the running loop.
+
+    Clients from other (typically already closed) loops are dropped, since
+    they cannot be closed from here.
+    """
+    loop = asyncio.get_running_loop()
+    entries = list(_OLLAMA_CLIENTS.values())
+    _OLLAMA_CLIENTS.clear()
+    for client_loop, client in entries:
+        if client_loop is loop:
+            await client.aclose()
+
+
+class RateLimiter:
+    """Async context manager admitting at most ``rate`` entries per ``period`` seconds.
+
+    A falsy rate disables limiting, so callers can always ``async with`` it.
+    """
+
+    def __init__(self, rate: Optional[int] = None, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._entries: Deque[float] = deque()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "RateLimiter":
+        if not self.rate:
+            return self
+        # A lock binds to the first loop that waits on it, so make a new one
+        # whenever the limiter is used from a different event loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._lock:
+            while True:
+                now = loop.time()
+                while self._entries and now - self._entries[0] >= self.period:
+                    self._entries.popleft()
+                if len(self._entries) < self.rate:
+                    self._entries.append(now)
+                    return self
+                # Wait until the oldest entry leaves the window
+                await asyncio.sleep(self.period - (now - self._entries[0]))
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+# Transcript tokens sent to the model, to stay within context limits
+MAX_INPUT_TOKENS = 12500
+
+# Tokenizer used to count transcript tokens; loaded on first use. Set to False
+# when loading fails (tiktoken downloads the encoding on first use, so this
+# happens offline) so the character budget is used without retrying every call.
+_ENCODING = None
+
+
+def truncate_to_tokens(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+    """Truncate text to at most max_tokens tokens.
+
+    Uses tiktoken's o200k_base encoding when installed and loadable (exact for
+    OpenAI models, a close estimate for the others), otherwise roughly four
+    characters per token.
+    """
+    global _ENCODING
+    if tiktoken is None or _ENCODING is False:
+        return text[:max_tokens * 4]
+    if _ENCODING is None:
+        try:
+            _ENCODING = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            print(f"Could not load tiktoken encoding, using a character budget instead: {e}")
+            _ENCODING = False
+            return text[:max_tokens * 4]
+    tokens = _ENCODING.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return _ENCODING.decode(tokens[:max_tokens])
+
+# Prompt pieces that only depend on the summarizer's settings, filled once per
+# instance; the title and transcript are spliced in between on each call
+_PROMPT_PREFIX = (
+    "Please provide a succinct summary of around {} words of this video transcript.\n"
+    "The video title is: "
+)
+_PROMPT_TRANSCRIPT = "\n\nTranscript:\n"
+_PROMPT_SUFFIX = (
+    "\n\nFocus on the key points and main takeaways.\n"
+    "In your response, output only the summary text itself:\n"
+    "- Do NOT include any preamble like 'Summary:' or 'Here is a summary'.\n"
+    "- Do NOT repeat or restate the talk title.\n"
+    "- Do NOT list the speakers; assume they are handled separately."
+)
+# Variant that also asks for present tense and no narration about the video
+_PROMPT_SUFFIX_PRESENT_TENSE = (
+    "\n\nFocus on the key points and main takeaways.\n"
+    "Write the summary in present tense, as if you are directly conveying the talk's content "
+    "while it is being given, not talking about the video or transcript itself.\n"
+    "In your response, output only the summary text itself:\n"
+    "- Do NOT include any preamble like 'Summary:' or 'Here is a summary'.\n"
+    "- Do NOT say phrases like 'in this video', 'the speaker says', or 'this talk'.\n"
+    "- Do NOT repeat or restate the talk title.\n"
+    "- Do NOT list the speakers; assume they are handled separately."
+)
+
 
 class Summarizer(ABC):
     """Base class for text summarization strategies."""
+
+    _prompt_prefix = _PROMPT_PREFIX.format(800)
+    _prompt_suffix = _PROMPT_SUFFIX
+    # Transcript token budget per request; override per instance if needed
+    max_input_tokens = MAX_INPUT_TOKENS
+
+    def _build_prompt(self, text: str, title: str) -> str:
+        """Assemble the prompt from the prefix and suffix precomputed in __init__."""
+        return "".join((
+            self._prompt_prefix, title, _PROMPT_TRANSCRIPT,
+            truncate_to_tokens(text, self.max_input_tokens), self._prompt_suffix,
+        ))
     
     @abstractmethod
     async def summarize(self, text: str, title: str) -> str:
@@ -28,13 +190,15 @@ class Summarizer(ABC):
 class AnthropicSummarizer(Summarizer):
     """AI-powered summarization using Anthropic's Claude."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-haiku-20241022", summary_length: int = 800):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-haiku-20241022", summary_length: int = 800, max_connections: int = DEFAULT_MAX_CONNECTIONS, rpm: Optional[int] = None):
         """
         Initialize Anthropic summarizer.
         
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
             model: Claude model to use
+            max_connections: Size of the pooled HTTP/2 connection pool
+            rpm: Maximum requests per minute sent to the API (None for unlimited)
         """
         import anthropic
         
@@ -42,35 +206,35 @@ class AnthropicSummarizer(Summarizer):
         if not self.api_key:
             raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY environment variable.")
         
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        # Async client so each request yields the event loop instead of blocking it
+        self.client = anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(http2=True, limits=_http_limits(max_connections)),
+        )
         self.model = model
         self.summary_length = summary_length
+        self._prompt_prefix = _PROMPT_PREFIX.format(summary_length)
+        self._prompt_suffix = _PROMPT_SUFFIX_PRESENT_TENSE
+        self.rpm = rpm
+        self._limiter = RateLimiter(rpm)
     
     async def summarize(self, text: str, title: str) -> str:
         """Summarize text using Claude API."""
-        prompt = f"""Please provide a succinct summary of around {self.summary_length} words of this video transcript.
-The video title is: {title}
-
-Transcript:
-{text[:50000]}  # Limit to avoid token limits
-
-Focus on the key points and main takeaways.
-Write the summary in present tense, as if you are directly conveying the talk's content while it is being given, not talking about the video or transcript itself.
-In your response, output only the summary text itself:
-- Do NOT include any preamble like 'Summary:' or 'Here is a summary'.
-- Do NOT say phrases like 'in this video', 'the speaker says', or 'this talk'.
-- Do NOT repeat or restate the talk title.
-- Do NOT list the speakers; assume they are handled separately."""
-        
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return message.content[0].text
+            prompt = self._build_prompt(text, title)
+
+            # Stream the response so tokens are consumed as they are generated
+            # and long generations do not sit on one idle HTTP read
+            async with self._limiter:
+                async with self.client.messages.stream(
+                    model=self.model,
+                    max_tokens=1024,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                ) as stream:
+                    parts = [chunk async for chunk in stream.text_stream]
+            return "".join(parts)
         except Exception as e:
             print(f"Error with Anthropic summarization: {e}")
             return "Summary unavailable due to an error."
@@ -79,47 +243,53 @@ In your response, output only the summary text itself:
 class OpenAISummarizer(Summarizer):
     """AI-powered summarization using OpenAI's GPT models."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini", summary_length: int = 800):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini", summary_length: int = 800, max_connections: int = DEFAULT_MAX_CONNECTIONS, rpm: Optional[int] = None):
         """
         Initialize OpenAI summarizer.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: OpenAI model to use
+            max_connections: Size of the pooled HTTP/2 connection pool
+            rpm: Maximum requests per minute sent to the API (None for unlimited)
         """
-        from openai import AsyncOpenAI
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
         
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=DefaultAsyncHttpxClient(http2=True, limits=_http_limits(max_connections)),
+        )
         self.model = model
         self.summary_length = summary_length
+        self._prompt_prefix = _PROMPT_PREFIX.format(summary_length)
+        self.rpm = rpm
+        self._limiter = RateLimiter(rpm)
     
     async def summarize(self, text: str, title: str) -> str:
         """Summarize text using OpenAI API."""
-        prompt = f"""Please provide a succinct summary of around {self.summary_length} words of this video transcript.
-The video title is: {title}
-
-Transcript:
-{text[:50000]}  # Limit to avoid token limits
-
-Focus on the key points and main takeaways.
-In your response, output only the summary text itself:
-- Do NOT include any preamble like 'Summary:' or 'Here is a summary'.
-- Do NOT repeat or restate the talk title.
-- Do NOT list the speakers; assume they are handled separately."""
-        
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1024
-            )
-            return response.choices[0].message.content
+            prompt = self._build_prompt(text, title)
+
+            # Stream the response so tokens are consumed as they are generated
+            # and long generations do not sit on one idle HTTP read
+            async with self._limiter:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=1024,
+                    stream=True,
+                )
+                parts = []
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+            return "".join(parts)
         except Exception as e:
             print(f"Error with OpenAI summarization: {e}")
             return "Summary unavailable due to an error."
@@ -128,13 +298,14 @@ In your response, output only the summary text itself:
 class GeminiSummarizer(Summarizer):
     """AI-powered summarization using Google's Gemini."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.0-flash-exp", summary_length: int = 800):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.0-flash-exp", summary_length: int = 800, rpm: Optional[int] = None):
         """
         Initialize Gemini summarizer.
         
         Args:
             api_key: Google API key (defaults to GOOGLE_API_KEY env var)
             model: Gemini model to use
+            rpm: Maximum requests per minute sent to the API (None for unlimited)
         """
         import google.generativeai as genai
         
@@ -145,30 +316,28 @@ class GeminiSummarizer(Summarizer):
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(model)
         self.summary_length = summary_length
+        self._prompt_prefix = _PROMPT_PREFIX.format(summary_length)
+        self.rpm = rpm
+        self._limiter = RateLimiter(rpm)
     
     async def summarize(self, text: str, title: str) -> str:
         """Summarize text using Gemini API with retry logic."""
         import asyncio
         import time
         
-        prompt = f"""Please provide a succinct summary of around {self.summary_length} words of this video transcript.
-The video title is: {title}
-
-Transcript:
-{text[:50000]}  # Limit to avoid token limits
-
-Focus on the key points and main takeaways.
-In your response, output only the summary text itself:
-- Do NOT include any preamble like 'Summary:' or 'Here is a summary'.
-- Do NOT repeat or restate the talk title.
-- Do NOT list the speakers; assume they are handled separately."""
+        try:
+            prompt = self._build_prompt(text, title)
+        except Exception as e:
+            print(f"Error with Gemini summarization: {e}")
+            return "Summary unavailable due to an error."
         
         max_retries = 3
         base_delay = 2
         
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content(prompt)
+                async with self._limiter:
+                    response = await self.model.generate_content_async(prompt)
                 return response.text
             except Exception as e:
                 error_str = str(e)
@@ -201,59 +370,85 @@ In your response, output only the summary text itself:
 class OllamaSummarizer(Summarizer):
     """Summarization using a local Ollama server."""
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "granite3.3:2b", sequential: bool = True, summary_length: int = 800):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "granite3.3:2b", sequential: bool = True, summary_length: int = 800, max_connections: int = DEFAULT_MAX_CONNECTIONS, rpm: Optional[int] = None):
         """Initialize Ollama summarizer.
 
         Args:
             base_url: Base URL for the Ollama server
             model: Ollama model to use (e.g., "granite3.3:2b")
-            sequential: If True, serialize summarize() calls (useful for single-request-at-a-time servers)
+            sequential: If True, serialize summarize() calls (useful for single-request-at-a-time servers);
+                otherwise up to 4 run at once. OLLAMA_MAX_CONCURRENCY overrides either limit.
+            max_connections: Size of the pooled HTTP connection pool
+            rpm: Maximum requests per minute sent to the server (None for unlimited)
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.summary_length = summary_length
+        self._prompt_prefix = _PROMPT_PREFIX.format(summary_length)
+        self._prompt_suffix = _PROMPT_SUFFIX_PRESENT_TENSE
+        self.rpm = rpm
+        self._limiter = RateLimiter(rpm)
 
         # Sequential mode can be enabled either via constructor flag or env var OLLAMA_SEQUENTIAL
         env_seq = os.environ.get("OLLAMA_SEQUENTIAL", "").lower() in ("1", "true", "yes")
         self._sequential = sequential or env_seq
-        self._lock: Optional[asyncio.Lock] = asyncio.Lock() if self._sequential else None
-        # Use a single async client for efficiency
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=60.0)
+        # Admission control: at most _max generations in flight. Sequential mode
+        # admits one at a time; OLLAMA_MAX_CONCURRENCY overrides either default
+        # and set_max() resizes it at runtime.
+        self._max = max(1, int(os.environ.get("OLLAMA_MAX_CONCURRENCY", "1" if self._sequential else "4")))
+        self._active = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._cond_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.max_connections = max_connections
+
+    def _condition(self) -> asyncio.Condition:
+        # A condition binds to the first loop that waits on it, so make a new
+        # one per event loop; calls counted on an earlier loop are gone with it
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+            self._active = 0
+        return self._cond
+
+    async def set_max(self, n: int) -> None:
+        """Change how many summarize() calls may run against the server at once."""
+        cond = self._condition()
+        async with cond:
+            self._max = max(1, n)
+            # Wake every waiter; those that now fit under the limit are admitted
+            cond.notify_all()
 
     async def summarize(self, text: str, title: str) -> str:
-        """Summarize text, optionally enforcing sequential calls when requested."""
-        if self._lock is not None:
-            async with self._lock:
-                return await self._summarize_once(text, title)
-        return await self._summarize_once(text, title)
+        """Summarize text, admitting at most the configured number of calls at once."""
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self._active < self._max)
+            self._active += 1
+        try:
+            return await self._summarize_once(text, title)
+        finally:
+            async with cond:
+                self._active -= 1
+                cond.notify(1)
 
     async def _summarize_once(self, text: str, title: str) -> str:
         """Summarize text using the Ollama chat API."""
-        prompt = f"""Please provide a succinct summary of around {self.summary_length} words of this video transcript.
-The video title is: {title}
-
-Transcript:
-{text[:50000]}
-
-Focus on the key points and main takeaways.
-Write the summary in present tense, as if you are directly conveying the talk's content while it is being given, not talking about the video or transcript itself.
-In your response, output only the summary text itself:
-- Do NOT include any preamble like 'Summary:' or 'Here is a summary'.
-- Do NOT say phrases like 'in this video', 'the speaker says', or 'this talk'.
-- Do NOT repeat or restate the talk title.
-- Do NOT list the speakers; assume they are handled separately."""
-
         try:
-            response = await self._client.post(
-                "/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ],
-                    "stream": False,
-                },
-            )
+            prompt = self._build_prompt(text, title)
+
+            async with self._limiter:
+                # Reuse the pool shared by all summarizers talking to this server
+                response = await _get_ollama_client(self.base_url, self.max_connections).post(
+                    "/api/chat",
+                    json={
+                        "model": self.model,
+                        "messages": [
+                            {"role": "user", "content": prompt}
+                        ],
+                        "stream": False,
+                    },
+                )
             response.raise_for_status()
             data = response.json()
 